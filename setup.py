@@ -0,0 +1,8 @@
+"""Builds the optional Cython fast path: python setup.py build_ext --inplace"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="applehealthexport",
+    ext_modules=cythonize("_parse.pyx"),
+)